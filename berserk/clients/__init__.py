@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import requests
 
+from ..session import mount_pool
 from .analysis import Analysis
 from .base import BaseClient
 from .account import Account
@@ -80,6 +81,9 @@ class Client(BaseClient):
         when possible. This defaults to ``False`` and is used as a fallback when
         ``as_pgn`` is left as ``None`` for methods that support it.
     :param tablebase_url: URL for tablebase lookups
+
+    The client can be used as a context manager, in which case the underlying session
+    (and its pooled connections) is closed on exit.
     """
 
     def __init__(
@@ -91,7 +95,9 @@ class Client(BaseClient):
         tablebase_url: str | None = None,
         explorer_url: str | None = None,
     ):
-        session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            mount_pool(session)
         super().__init__(session, base_url)
         self.account = Account(session, base_url)
         self.analysis = Analysis(session, base_url)
@@ -114,3 +120,13 @@ class Client(BaseClient):
         self.opening_explorer = OpeningExplorer(session, explorer_url)
         self.bulk_pairings = BulkPairings(session, base_url)
         self.external_engine = ExternalEngine(session, base_url)
+
+    def close(self) -> None:
+        """Close the underlying session and release its pooled connections."""
+        self._r.session.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
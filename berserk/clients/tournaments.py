@@ -1,13 +1,77 @@
 from __future__ import annotations
 
-from typing import Iterator, Any, Dict, List, cast
-
-from .. import models
-from ..formats import NDJSON, NDJSON_LIST, PGN, TEXT
+from collections import deque
+from contextlib import closing
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Callable,
+    Deque,
+    Generator,
+    Iterable,
+    Iterator,
+    Any,
+    Dict,
+    List,
+    TypeVar,
+    cast,
+)
+
+from .. import models, utils
+from ..formats import NDJSON, NDJSON_RAW, PGN, PGN_RAW, TEXT
 from .base import FmtClient
 from ..types import ArenaResult, CurrentTournaments, SwissInfo, SwissResult
 from ..types.tournaments import TeamBattleResult
 
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+# Server-side defaults of the tournament game exports, which need not be sent
+_GAME_EXPORT_DEFAULTS = {
+    "moves": True,
+    "pgnInJson": False,
+    "tags": True,
+    "clocks": False,
+    "opening": False,
+}
+
+
+def _without_defaults(params: Dict[str, bool]) -> Dict[str, bool]:
+    return {k: v for k, v in params.items() if _GAME_EXPORT_DEFAULTS.get(k) is not v}
+
+
+def _map_concurrently(
+    executor: ThreadPoolExecutor,
+    func: Callable[[T], U],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Generator[U, None, None]:
+    """Like ``executor.map``, but consume the items lazily and keep at most
+    ``max_in_flight`` calls pending, cancelling those left when the caller stops."""
+    pending: Deque[Future[U]] = deque()
+    try:
+        for item in items:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _run_concurrently(
+    func: Callable[[str], None], tournament_ids: Iterable[str], max_workers: int
+) -> None:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # consume the results so that the first error is raised, which stops the
+        # submission of the remaining IDs and cancels those still queued
+        for _ in _map_concurrently(
+            executor, func, tournament_ids, max_in_flight=max_workers
+        ):
+            pass
+
 
 class Tournaments(FmtClient):
     """Client for tournament-related endpoints."""
@@ -18,9 +82,8 @@ class Tournaments(FmtClient):
         :return: current arenas
         """
         path = "/api/tournament"
-        return cast(
-            CurrentTournaments,
-            self._r.get(path, converter=models.Tournament.convert_values),
+        return self._r.get(  # type: ignore[return-value]
+            path, converter=models.Tournament.convert_values
         )
 
     def get_tournament(self, tournament_id: str, page: int = 1) -> Dict[str, Any]:
@@ -33,6 +96,73 @@ class Tournaments(FmtClient):
         path = f"/api/tournament/{tournament_id}?page={page}"
         return self._r.get(path, converter=models.Tournament.convert)
 
+    def get_tournaments(
+        self, tournament_ids: Iterable[str], page: int = 1, max_workers: int = 8
+    ) -> Iterator[Dict[str, Any]]:
+        """Get information about several arenas, fetching them concurrently.
+
+        The IDs are consumed lazily, so they can come from another stream. If the
+        iteration stops early, the requests still pending are cancelled.
+
+        :param tournament_ids: tournament IDs
+        :param page: the page number of the player standings to view
+        :param max_workers: maximum number of requests in flight at once; keep it at
+            or below :data:`berserk.session.POOL_MAXSIZE`, the number of connections
+            the default session keeps alive, or the extra ones are discarded
+        :return: iterator over the tournament information, in the order of the IDs
+        """
+
+        def fetch(tournament_id: str) -> Dict[str, Any]:
+            return self.get_tournament(tournament_id, page)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from _map_concurrently(
+                executor, fetch, tournament_ids, max_in_flight=max_workers
+            )
+
+    def get_tournament_pages(
+        self, tournament_id: str, max_pages: int | None = None, max_workers: int = 4
+    ) -> Iterator[Dict[str, Any]]:
+        """Get information about an arena, once per page of the player standings.
+
+        The first page is used to find out how many pages there are, the remaining
+        ones are then fetched concurrently.
+
+        :param tournament_id: tournament ID
+        :param max_pages: maximum number of pages to fetch (at least 1), all of them by
+            default
+        :param max_workers: maximum number of requests in flight at once; keep it at
+            or below :data:`berserk.session.POOL_MAXSIZE`, the number of connections
+            the default session keeps alive, or the extra ones are discarded
+        :return: iterator over the tournament information, one per page in order
+        :raises ValueError: if ``max_pages`` is less than 1
+        """
+        if max_pages is not None and max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1, got {max_pages}")
+
+        first_page = self.get_tournament(tournament_id)
+        yield first_page
+
+        # the standings are paginated by 10 players
+        nb_pages = -(-first_page.get("nbPlayers", 0) // 10)
+        if max_pages is not None:
+            nb_pages = min(nb_pages, max_pages)
+
+        def fetch(page: int) -> Dict[str, Any]:
+            return self.get_tournament(tournament_id, page)
+
+        # pages are requested at most max_workers at a time, so that stopping at an
+        # empty page does not leave the remaining ones to be fetched
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, closing(
+            _map_concurrently(
+                executor, fetch, range(2, nb_pages + 1), max_in_flight=max_workers
+            )
+        ) as pages:
+            for info in pages:
+                if not info.get("standing", {}).get("players"):
+                    break
+                yield info
+
     def join_arena(
         self,
         tournament_id: str,
@@ -161,7 +291,9 @@ class Tournaments(FmtClient):
             "conditions.maxRating.rating": maxRating,
             "conditions.nbRatedGame.nb": nbRatedGame,
         }
-        return self._r.post(path, json=payload, converter=models.Tournament.convert)
+        return self._r.post(
+            path, json=utils.compact(payload), converter=models.Tournament.convert
+        )
 
     def create_swiss(
         self,
@@ -215,7 +347,9 @@ class Tournaments(FmtClient):
             "rated": rated,
             "chatFor": chatFor,
         }
-        return self._r.post(path, json=payload, converter=models.Tournament.convert)
+        return self._r.post(
+            path, json=utils.compact(payload), converter=models.Tournament.convert
+        )
 
     def export_arena_games(
         self,
@@ -226,7 +360,8 @@ class Tournaments(FmtClient):
         clocks: bool = False,
         evals: bool = True,
         opening: bool = False,
-    ) -> Iterator[str] | Iterator[Dict[str, Any]]:
+        raw: bool = False,
+    ) -> Iterator[str] | Iterator[Dict[str, Any]] | Iterator[bytes]:
         """Export games from an arena tournament.
 
         :param id: tournament ID
@@ -237,7 +372,10 @@ class Tournaments(FmtClient):
         :param evals: include analysis evaluation comments in the PGN moves, when
             available
         :param opening: include the opening name
-        :return: iterator over the exported games, as JSON or PGN
+        :param raw: return the undecoded bytes of the response as they arrive, e.g. to
+            write them straight to a file
+        :return: iterator over the exported games, as JSON or PGN, or over chunks of
+            bytes when ``raw`` is set
         """
         path = f"/api/tournament/{id}/games"
         params = {
@@ -247,10 +385,14 @@ class Tournaments(FmtClient):
             "evals": evals,
             "opening": opening,
         }
+        params = _without_defaults(params)
+        if raw:
+            fmt = PGN_RAW if self._use_pgn(as_pgn) else NDJSON_RAW
+            return self._r.get(path, params=params, fmt=fmt, stream=True)
         if self._use_pgn(as_pgn):
-            yield from self._r.get(path, params=params, fmt=PGN, stream=True)
+            return self._r.get(path, params=params, fmt=PGN, stream=True)
         else:
-            yield from self._r.get(
+            return self._r.get(
                 path,
                 params=params,
                 fmt=NDJSON,
@@ -268,7 +410,8 @@ class Tournaments(FmtClient):
         clocks: bool = False,
         evals: bool = True,
         opening: bool = False,
-    ) -> Iterator[str] | Iterator[Dict[str, Any]]:
+        raw: bool = False,
+    ) -> Iterator[str] | Iterator[Dict[str, Any]] | Iterator[bytes]:
         """Export games from a swiss tournament.
 
         :param id: tournament id
@@ -279,21 +422,28 @@ class Tournaments(FmtClient):
         :param clocks: include clock comments
         :param evals: include analysis evaluation comments in the PGN, when available
         :param opening: include the opening name
-        :return: iterator over the exported games, as JSON or PGN
+        :param raw: return the undecoded bytes of the response as they arrive, e.g. to
+            write them straight to a file
+        :return: iterator over the exported games, as JSON or PGN, or over chunks of
+            bytes when ``raw`` is set
         """
         path = f"/api/swiss/{id}/games"
         params = {
-            "moves:": moves,
+            "moves": moves,
             "pgnInJson": pgnInJson,
             "tags": tags,
             "clocks": clocks,
             "evals": evals,
             "opening": opening,
         }
+        params = _without_defaults(params)
+        if raw:
+            fmt = PGN_RAW if self._use_pgn(as_pgn) else NDJSON_RAW
+            return self._r.get(path, params=params, fmt=fmt, stream=True)
         if self._use_pgn(as_pgn):
-            yield from self._r.get(path, params=params, fmt=PGN, stream=True)
+            return self._r.get(path, params=params, fmt=PGN, stream=True)
         else:
-            yield from self._r.get(
+            return self._r.get(
                 path,
                 params=params,
                 fmt=NDJSON,
@@ -319,14 +469,7 @@ class Tournaments(FmtClient):
         :param nb: max number of tournaments to fetch
         :return: arena tournaments info
         """
-
-        path = f"/api/user/{username}/tournament/created"
-        params = {
-            "nb": nb,
-        }
-        return self._r.get(
-            path, params=params, fmt=NDJSON_LIST, converter=models.Game.convert
-        )
+        return list(self.stream_by_creator(username, nb=nb))
 
     def arenas_by_team(
         self, teamId: str, maxT: int | None = None
@@ -337,12 +480,27 @@ class Tournaments(FmtClient):
         :param maxT: how many tournaments to download
         :return: arena tournaments
         """
+        return list(self.stream_arenas_by_team(teamId, maxT=maxT))
+
+    def stream_arenas_by_team(
+        self, teamId: str, maxT: int | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream arenas created for a team.
+
+        :param teamId: team ID
+        :param maxT: how many tournaments to download
+        :return: iterator over the arena tournaments
+        """
         path = f"/api/team/{teamId}/arena"
         params = {
             "max": maxT,
         }
         return self._r.get(
-            path, params=params, fmt=NDJSON_LIST, converter=models.Game.convert
+            path,
+            params=params,
+            fmt=NDJSON,
+            stream=True,
+            converter=models.Tournament.convert,
         )
 
     def swiss_by_team(
@@ -354,12 +512,27 @@ class Tournaments(FmtClient):
         :param maxT: how many tournaments to download
         :return: swiss tournaments
         """
+        return list(self.stream_swiss_by_team(teamId, maxT=maxT))
+
+    def stream_swiss_by_team(
+        self, teamId: str, maxT: int | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream swiss tournaments created for a team.
+
+        :param teamId: team ID
+        :param maxT: how many tournaments to download
+        :return: iterator over the swiss tournaments
+        """
         path = f"/api/team/{teamId}/swiss"
         params = {
             "max": maxT,
         }
         return self._r.get(
-            path, params=params, fmt=NDJSON_LIST, converter=models.Game.convert
+            path,
+            params=params,
+            fmt=NDJSON,
+            stream=True,
+            converter=models.Tournament.convert,
         )
 
     def stream_results(
@@ -377,16 +550,28 @@ class Tournaments(FmtClient):
         """
         path = f"/api/tournament/{id}/results"
         params = {"nb": limit}
-        yield from self._r.get(path, params=params, stream=True)
+        return self._r.get(path, params=params, stream=True)
 
-    def stream_by_creator(self, username: str) -> Iterator[Dict[str, Any]]:
+    def stream_by_creator(
+        self, username: str, nb: int | None = None
+    ) -> Iterator[Dict[str, Any]]:
         """Stream the tournaments created by a player.
 
         :param username: username of the player
+        :param nb: max number of tournaments to fetch
         :return: iterator over the tournaments
         """
         path = f"/api/user/{username}/tournament/created"
-        yield from self._r.get(path, stream=True)
+        params = {
+            "nb": nb,
+        }
+        return self._r.get(
+            path,
+            params=params,
+            fmt=NDJSON,
+            stream=True,
+            converter=models.Tournament.convert,
+        )
 
     def get_swiss(self, tournament_id: str) -> SwissInfo:
         """Get detailed info about a Swiss tournament.
@@ -411,7 +596,7 @@ class Tournaments(FmtClient):
         """
         path = f"/api/swiss/{tournament_id}/results"
         params = {"nb": limit}
-        yield from self._r.get(path, params=params, stream=True)
+        return self._r.get(path, params=params, stream=True)
 
     def edit_swiss(
         self,
@@ -477,7 +662,7 @@ class Tournaments(FmtClient):
             "conditions.allowList": allowList,
             "chatFor": chatFor,
         }
-        return self._r.post(path, json=payload)
+        return self._r.post(path, json=utils.compact(payload))
 
     def join_swiss(self, tournament_id: str, password: str | None = None) -> None:
         """Join a Swiss tournament, possibly with a password.
@@ -487,7 +672,7 @@ class Tournaments(FmtClient):
         """
         path = f"/api/swiss/{tournament_id}/join"
         payload = {"password": password}
-        self._r.post(path, json=payload)
+        self._r.post(path, json=utils.compact(payload))
 
     def terminate_arena(self, tournament_id: str) -> None:
         """Terminate an Arena tournament.
@@ -497,6 +682,20 @@ class Tournaments(FmtClient):
         path = f"/api/tournament/{tournament_id}/terminate"
         self._r.post(path)
 
+    def terminate_arena_many(
+        self, tournament_ids: Iterable[str], max_workers: int = 8
+    ) -> None:
+        """Terminate several Arena tournaments concurrently.
+
+        If a request fails, no further ones are sent and its error is raised once those
+        already running have finished. Every tournament before the failing one has
+        then been terminated, and up to ``max_workers - 1`` after it may have been too.
+
+        :param tournament_ids: tournament IDs
+        :param max_workers: maximum number of requests in flight at once
+        """
+        _run_concurrently(self.terminate_arena, tournament_ids, max_workers)
+
     def terminate_swiss(self, tournament_id: str) -> None:
         """Terminate a Swiss tournament.
 
@@ -505,6 +704,20 @@ class Tournaments(FmtClient):
         path = f"/api/swiss/{tournament_id}/terminate"
         self._r.post(path)
 
+    def terminate_swiss_many(
+        self, tournament_ids: Iterable[str], max_workers: int = 8
+    ) -> None:
+        """Terminate several Swiss tournaments concurrently.
+
+        If a request fails, no further ones are sent and its error is raised once those
+        already running have finished. Every tournament before the failing one has
+        then been terminated, and up to ``max_workers - 1`` after it may have been too.
+
+        :param tournament_ids: the Swiss tournament IDs.
+        :param max_workers: maximum number of requests in flight at once
+        """
+        _run_concurrently(self.terminate_swiss, tournament_ids, max_workers)
+
     def withdraw_arena(self, tournament_id: str) -> None:
         """Leave an upcoming Arena tournament, or take a break on an ongoing Arena tournament.
 
@@ -513,6 +726,20 @@ class Tournaments(FmtClient):
         path = f"/api/tournament/{tournament_id}/withdraw"
         self._r.post(path)
 
+    def withdraw_arena_many(
+        self, tournament_ids: Iterable[str], max_workers: int = 8
+    ) -> None:
+        """Leave or take a break on several Arena tournaments concurrently.
+
+        If a request fails, no further ones are sent and its error is raised once those
+        already running have finished. Every tournament before the failing one has
+        then been left, and up to ``max_workers - 1`` after it may have been too.
+
+        :param tournament_ids: tournament IDs
+        :param max_workers: maximum number of requests in flight at once
+        """
+        _run_concurrently(self.withdraw_arena, tournament_ids, max_workers)
+
     def withdraw_swiss(self, tournament_id: str) -> None:
         """Withdraw a Swiss tournament.
 
@@ -521,6 +748,20 @@ class Tournaments(FmtClient):
         path = f"/api/swiss/{tournament_id}/withdraw"
         self._r.post(path)
 
+    def withdraw_swiss_many(
+        self, tournament_ids: Iterable[str], max_workers: int = 8
+    ) -> None:
+        """Withdraw from several Swiss tournaments concurrently.
+
+        If a request fails, no further ones are sent and its error is raised once those
+        already running have finished. Every tournament before the failing one has
+        then been withdrawn from, and up to ``max_workers - 1`` after it may have been too.
+
+        :param tournament_ids: the Swiss tournament IDs.
+        :param max_workers: maximum number of requests in flight at once
+        """
+        _run_concurrently(self.withdraw_swiss, tournament_ids, max_workers)
+
     def schedule_swiss_next_round(self, tournament_id: str, schedule_time: int) -> None:
         """Manually schedule the next round date and time of a Swiss tournament.
 
@@ -2,11 +2,16 @@ from __future__ import annotations
 import json
 from typing import Any, Callable, Dict, Generic, Iterator, List, Type, TypeVar, cast
 
-import ndjson  # type: ignore
 from requests import Response
 
 from . import utils
 
+try:
+    # orjson is an optional, much faster drop-in for decoding (it also takes bytes)
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:
+    from json import loads as json_loads
+
 T = TypeVar("T")
 
 
@@ -95,8 +100,27 @@ class JsonHandler(FormatHandler[Dict[str, Any]]):
         """
         for line in response.iter_lines():
             if line:
-                decoded_line = line.decode("utf-8")
-                yield json.loads(decoded_line)
+                yield json_loads(line)
+
+
+class NdjsonHandler(JsonHandler):
+    """Handle newline-delimited JSON data.
+
+    :param str mime_type: the MIME type for the format
+    """
+
+    def __init__(self, mime_type: str = "application/x-ndjson"):
+        super().__init__(mime_type=mime_type)
+
+    def parse(self, response: Response) -> Any:
+        """Parse all JSON objects from a response.
+
+        :param response: raw response
+        :type response: :class:`requests.Response`
+        :return: list of response objects
+        :rtype: list
+        """
+        return [json_loads(line) for line in response.content.splitlines() if line]
 
 
 class PgnHandler(FormatHandler[str]):
@@ -122,19 +146,45 @@ class PgnHandler(FormatHandler[str]):
         :type response: :class:`requests.Response`
         :return: iterator over multiple PGN texts
         """
-        lines: List[str] = []
-        last_line = True
+        # games are decoded as a whole rather than line by line
+        lines: List[bytes] = []
+        last_line: bytes | bool = True
         for line in response.iter_lines():
-            decoded_line = line.decode("utf-8")
-            if last_line or decoded_line:
-                lines.append(decoded_line)
+            if last_line or line:
+                lines.append(line)
             else:
-                yield "\n".join(lines).strip()
+                yield b"\n".join(lines).decode("utf-8").strip()
                 lines = []
-            last_line = decoded_line
+            last_line = line
 
         if lines:
-            yield "\n".join(lines).strip()
+            yield b"\n".join(lines).decode("utf-8").strip()
+
+
+class RawHandler(FormatHandler[bytes]):
+    """Pass the response body through without decoding it.
+
+    :param str mime_type: the MIME type for the format
+    """
+
+    def parse(self, response: Response) -> bytes:
+        """Return the raw body of a response.
+
+        :param response: raw response
+        :type response: :class:`requests.Response`
+        :return: response body
+        :rtype: bytes
+        """
+        return response.content
+
+    def parse_stream(self, response: Response) -> Iterator[bytes]:
+        """Yield the raw body of a stream response as it arrives.
+
+        :param response: raw response
+        :type response: :class:`requests.Response`
+        :return: iterator over chunks of the response body
+        """
+        yield from response.iter_content(chunk_size=None)
 
 
 class TextHandler(FormatHandler[str]):
@@ -161,10 +211,16 @@ JSON_LIST = cast(FormatHandler[List[Dict[str, Any]]], JSON)
 LIJSON = JsonHandler(mime_type="application/vnd.lichess.v3+json")
 
 #: Handles newline-delimited JSON
-NDJSON = JsonHandler(mime_type="application/x-ndjson", decoder=ndjson.Decoder)  # type: ignore
+NDJSON = NdjsonHandler()
 
 #: Handles newline-delimited JSON where the response is a top-level list (this is only needed bc of type checking, if not streaming NJDSON, the result is always a list)
 NDJSON_LIST = cast(FormatHandler[List[Dict[str, Any]]], NDJSON)
 
 #: Handles PGN
 PGN = PgnHandler()
+
+#: Passes newline-delimited JSON through as raw bytes
+NDJSON_RAW = RawHandler(mime_type="application/x-ndjson")
+
+#: Passes PGN through as raw bytes
+PGN_RAW = RawHandler(mime_type="application/x-chess-pgn")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, TypeVar, overload
+from typing import Any, Dict, List, Tuple, TypeVar, overload
 
 from . import utils
 
@@ -8,9 +8,16 @@ T = TypeVar("T")
 
 
 class model(type):
+    _conversions: Dict[str, Any]
+
+    def __init__(cls, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # computed once per model rather than on every conversion
+        cls._conversions = {k: v for k, v in vars(cls).items() if not k.startswith("_")}
+
     @property
     def conversions(cls):
-        return {k: v for k, v in vars(cls).items() if not k.startswith("_")}
+        return cls._conversions
 
 
 class Model(metaclass=model):
@@ -36,8 +43,9 @@ class Model(metaclass=model):
 
     @classmethod
     def convert_one(cls, data: Dict[str, T]) -> Dict[str, T]:
-        for k in set(data) & set(cls.conversions):
-            data[k] = cls.conversions[k](data[k])
+        for k, func in cls.conversions.items():
+            if k in data:
+                data[k] = func(data[k])
         return data
 
     @classmethod
@@ -15,11 +15,20 @@ from typing import (
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from berserk.formats import FormatHandler
 
 from . import exceptions, utils
 
+try:
+    # orjson is an optional, much faster replacement for encoding request bodies
+    import orjson  # type: ignore
+
+    json_dumps: Callable[[Any], bytes] | None = orjson.dumps  # type: ignore
+except ImportError:
+    json_dumps = None
+
 LOG = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -29,6 +38,9 @@ Params = Mapping[str, Union[int, bool, str, None]]
 Data = Union[str, Params]
 Converter = Callable[[T], T]
 
+#: Maximum number of pooled keep-alive connections kept per host
+POOL_MAXSIZE = 20
+
 
 class Requestor(Generic[T]):
     """Encapsulates the logic for making a request.
@@ -83,14 +95,21 @@ class Requestor(Generic[T]):
             data,
             json,
         )
+        headers = fmt.headers
+        body: Data | bytes | None = data
+        if json is not None and data is None and json_dumps is not None:
+            body = json_dumps(json)
+            json = None
+            headers = {**headers, "Content-Type": "application/json"}
+
         try:
             response = self.session.request(
                 method,
                 url,
                 stream=stream,
                 params=params,
-                headers=fmt.headers,
-                data=data,
+                headers=headers,
+                data=body,
                 json=json,
                 **kwargs,
             )
@@ -272,6 +291,17 @@ class Requestor(Generic[T]):
         )
 
 
+def mount_pool(session: requests.Session, pool_maxsize: int = POOL_MAXSIZE) -> None:
+    """Mount a connection pool on the session so that connections are kept alive
+    and reused across requests, including concurrent ones.
+
+    :param session: the session to mount the pool on
+    :param pool_maxsize: maximum number of connections to keep per host
+    """
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, HTTPAdapter(pool_maxsize=pool_maxsize))
+
+
 class TokenSession(requests.Session):
     """Session capable of personal API token authentication.
 
@@ -281,4 +311,7 @@ class TokenSession(requests.Session):
     def __init__(self, token: str):
         super().__init__()
         self.token = token
-        self.headers = {"Authorization": f"Bearer {token}"}
+        # update rather than replace, to keep the default headers (notably
+        # Accept-Encoding, so that large exports are sent compressed)
+        self.headers.update({"Authorization": f"Bearer {token}"})
+        mount_pool(self)
@@ -89,6 +89,11 @@ def noop(arg: T) -> T:
     return arg
 
 
+def compact(data: Dict[str, T | None]) -> Dict[str, T]:
+    """Return a copy of the data without the keys whose value is ``None``."""
+    return {k: v for k, v in data.items() if v is not None}
+
+
 def build_adapter(mapper: Dict[str, str], sep: str = "."):
     """Build a data adapter.
 
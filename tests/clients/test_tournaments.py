@@ -1,6 +1,12 @@
+from datetime import datetime, timezone
+from itertools import count, islice
+from unittest import mock
+
 import pytest
+import requests_mock
 
 from berserk import ArenaResult, Client, SwissResult
+from berserk.exceptions import ResponseError
 from typing import List
 
 from berserk.types.tournaments import TeamBattleResult
@@ -25,3 +31,179 @@ class TestLichessGames:
     def test_team_standings(self):
         res = Client().tournaments.get_team_standings("Qv0dRqml")
         validate(TeamBattleResult, res)
+
+    def test_export_swiss_games_moves_param(self):
+        """Verify that ``moves`` is sent under the right key"""
+        with requests_mock.Mocker() as m:
+            m.get("https://lichess.org/api/swiss/ADAHHiMX/games", text="")
+            list(Client().tournaments.export_swiss_games("ADAHHiMX", moves=False))
+            assert m.last_request.qs["moves"] == ["false"]
+            assert "moves:" not in m.last_request.qs
+
+    def test_create_arena_omits_unset_fields(self):
+        """Verify that unset optional fields are not sent as ``null``"""
+        with requests_mock.Mocker() as m:
+            m.post("https://lichess.org/api/tournament", json={})
+            Client().tournaments.create_arena(clockTime=3, clockIncrement=2, minutes=60)
+            assert m.last_request.json() == {
+                "clockTime": 3,
+                "clockIncrement": 2,
+                "minutes": 60,
+            }
+
+    def test_stream_arenas_by_team(self):
+        """Verify that team arenas are streamed and listed as tournaments"""
+        starts_at = datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://lichess.org/api/team/lichess-swiss/arena?max=2",
+                text=(
+                    '{"id": "a", "startsAt": 1700000000000, "createdAt": 1}\n'
+                    '{"id": "b", "startsAt": 1700000000000, "createdAt": 2}\n'
+                ),
+            )
+            tournaments = Client().tournaments
+            expected = [
+                {"id": "a", "startsAt": starts_at, "createdAt": 1},
+                {"id": "b", "startsAt": starts_at, "createdAt": 2},
+            ]
+            assert (
+                list(tournaments.stream_arenas_by_team("lichess-swiss", 2)) == expected
+            )
+            assert tournaments.arenas_by_team("lichess-swiss", 2) == expected
+
+    def test_stream_by_creator(self):
+        """Verify that created tournaments are converted as tournaments"""
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://lichess.org/api/user/thibault/tournament/created?nb=1",
+                text='{"id": "a", "startsAt": 1700000000000}\n',
+            )
+            res = list(Client().tournaments.stream_by_creator("thibault", nb=1))
+            assert res == [
+                {
+                    "id": "a",
+                    "startsAt": datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc),
+                }
+            ]
+            assert "application/x-ndjson" in m.last_request.headers["Accept"]
+
+    def test_get_tournaments(self):
+        """Verify that tournaments are returned in the order of the IDs"""
+        ids = ["a", "b", "c"]
+        with requests_mock.Mocker() as m:
+            for tid in ids:
+                m.get(
+                    f"https://lichess.org/api/tournament/{tid}?page=1", json={"id": tid}
+                )
+            res = list(Client().tournaments.get_tournaments(ids, max_workers=2))
+        assert [t["id"] for t in res] == ids
+
+    def test_get_tournaments_consumes_ids_lazily(self):
+        """Verify that an endless stream of IDs can be partially consumed"""
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, json={})
+            ids = (str(i) for i in count())
+            res = Client().tournaments.get_tournaments(ids, max_workers=2)
+            assert len(list(islice(res, 3))) == 3
+            res.close()
+            assert m.call_count <= 5
+
+    def test_get_tournament_pages(self):
+        """Verify that every page of the standings is fetched, in order"""
+        url = "https://lichess.org/api/tournament/abc?page="
+        with requests_mock.Mocker() as m:
+            for page in (1, 2, 3):
+                m.get(
+                    f"{url}{page}",
+                    json={"nbPlayers": 25, "standing": {"page": page, "players": [{}]}},
+                )
+            res = list(Client().tournaments.get_tournament_pages("abc"))
+            assert [info["standing"]["page"] for info in res] == [1, 2, 3]
+
+            res = list(Client().tournaments.get_tournament_pages("abc", max_pages=2))
+            assert [info["standing"]["page"] for info in res] == [1, 2]
+
+    def test_get_tournament_pages_stops_at_empty_page(self):
+        """Verify that no more pages are requested once an empty one is returned"""
+        url = "https://lichess.org/api/tournament/abc?page="
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, json={"nbPlayers": 1000, "standing": {}})
+            for page in (1, 2):
+                m.get(
+                    f"{url}{page}",
+                    json={
+                        "nbPlayers": 1000,
+                        "standing": {"page": page, "players": [{}]},
+                    },
+                )
+            tournaments = Client().tournaments
+            res = list(tournaments.get_tournament_pages("abc", max_workers=2))
+            assert [info["standing"]["page"] for info in res] == [1, 2]
+            assert m.call_count <= 5
+
+            with pytest.raises(ValueError):
+                list(tournaments.get_tournament_pages("abc", max_pages=0))
+
+    def test_join_swiss_without_password(self):
+        """Verify that no ``null`` password is sent"""
+        with requests_mock.Mocker() as m:
+            m.post("https://lichess.org/api/swiss/abc/join", json={})
+            Client().tournaments.join_swiss("abc")
+            assert m.last_request.json() == {}
+
+    def test_session_is_shared(self):
+        """Verify that streamed and regular calls go through the client's session"""
+        client = Client()
+        session = client._r.session
+        with requests_mock.Mocker() as m, mock.patch.object(
+            session, "request", wraps=session.request
+        ) as m_request:
+            m.get("https://lichess.org/api/tournament/abc?page=1", json={})
+            m.get("https://lichess.org/api/tournament/abc/results", text="")
+            client.tournaments.get_tournament("abc")
+            list(client.tournaments.stream_results("abc"))
+            assert m_request.call_count == 2
+
+    def test_terminate_arena_many(self):
+        """Verify that every tournament is terminated and errors are raised"""
+        with requests_mock.Mocker() as m:
+            for tid in ("a", "b"):
+                m.post(f"https://lichess.org/api/tournament/{tid}/terminate", json={})
+            m.post("https://lichess.org/api/tournament/c/terminate", status_code=404)
+            tournaments = Client().tournaments
+
+            tournaments.terminate_arena_many(["a", "b"])
+            assert m.call_count == 2
+
+            with pytest.raises(ResponseError):
+                tournaments.terminate_arena_many(["a", "c"])
+
+    def test_terminate_arena_many_stops_after_error(self):
+        """Verify that no further tournaments are terminated after a failure"""
+        with requests_mock.Mocker() as m:
+            m.post(requests_mock.ANY, json={})
+            m.post("https://lichess.org/api/tournament/c/terminate", status_code=404)
+            with pytest.raises(ResponseError):
+                Client().tournaments.terminate_arena_many(
+                    ["c", "a", "b"], max_workers=1
+                )
+            assert [r.path for r in m.request_history] == [
+                "/api/tournament/c/terminate"
+            ]
+
+    def test_export_arena_games_skips_server_defaults(self):
+        """Verify that only parameters differing from the server defaults are sent"""
+        with requests_mock.Mocker() as m:
+            m.get("https://lichess.org/api/tournament/abc/games", text="")
+            list(Client().tournaments.export_arena_games("abc", clocks=True))
+            assert m.last_request.qs == {"clocks": ["true"], "evals": ["true"]}
+
+    def test_export_arena_games_raw(self):
+        """Verify that the raw export passes the body through undecoded"""
+        body = b'{"id": "a", "createdAt": 1}\n{"id": "b", "createdAt": 2}\n'
+        with requests_mock.Mocker() as m:
+            m.get("https://lichess.org/api/tournament/abc/games", content=body)
+            res = Client().tournaments.export_arena_games("abc", raw=True)
+            assert b"".join(res) == body
+            assert m.last_request.headers["Accept"] == "application/x-ndjson"
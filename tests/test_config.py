@@ -1,3 +1,5 @@
+from unittest import mock
+
 import requests_mock
 
 import berserk
@@ -15,3 +17,16 @@ class TestTableBaseUrl:
         with requests_mock.Mocker() as m:
             m.get("https://my-tablebase.com/standard", json={})
             client.tablebase.look_up("4k3/6KP/8/8/8/8/7p/8_w_-_-_0_1")
+
+
+class TestSession:
+    def test_default_session_pool(self):
+        client = berserk.Client()
+        adapter = client._r.session.get_adapter("https://lichess.org")
+        assert adapter._pool_maxsize == berserk.session.POOL_MAXSIZE
+
+    def test_context_manager_closes_session(self):
+        with berserk.Client() as client:
+            adapter = client._r.session.get_adapter("https://lichess.org")
+            adapter.close = mock.Mock()
+        adapter.close.assert_called_once()
@@ -62,3 +62,21 @@ def test_pgn_handler_parse_stream():
 
     result = fmt.parse_stream(m_response)
     assert list(result) == ["one\ntwo", "three"]
+
+
+def test_ndjson_handler_parse():
+    fmt = fmts.NdjsonHandler()
+    m_response = mock.Mock()
+    m_response.content = b'{"x": 5}\n\n{"y": 3}\n'
+
+    result = fmt.parse(m_response)
+    assert result == [{"x": 5}, {"y": 3}]
+
+
+def test_raw_handler_parse_stream():
+    fmt = fmts.RawHandler("foo")
+    m_response = mock.Mock()
+    m_response.iter_content.return_value = [b'{"x": 5}\n{"y"', b": 3}\n"]
+
+    result = fmt.parse_stream(m_response)
+    assert list(result) == [b'{"x": 5}\n{"y"', b": 3}\n"]
@@ -8,3 +8,11 @@ def test_conversion():
     original = {"foo": "5", "bar": 3, "baz": "4"}
     modified = {"foo": 5, "bar": 3, "baz": "4"}
     assert Example.convert(original) == modified
+
+
+def test_conversions_are_cached():
+    class Example(models.Model):
+        foo = int
+
+    assert Example.conversions == {"foo": int}
+    assert Example.conversions is Example.conversions
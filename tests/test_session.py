@@ -31,6 +31,21 @@ def test_request():
     assert {"is_stream": False, "converter": utils.noop} == kwargs
 
 
+def test_request_json_body():
+    orjson = pytest.importorskip("orjson")
+    m_session = mock.Mock()
+    m_fmt = mock.Mock()
+    m_fmt.headers = {"Accept": "foo"}
+    requestor = session.Requestor(m_session, "http://foo.com/", m_fmt)
+
+    requestor.request("bar", "path", json={"a": 1, "b": None})
+
+    _, kwargs = m_session.request.call_args
+    assert kwargs["json"] is None
+    assert orjson.loads(kwargs["data"]) == {"a": 1, "b": None}
+    assert kwargs["headers"] == {"Accept": "foo", "Content-Type": "application/json"}
+
+
 def test_bad_request():
     m_session = mock.Mock()
     m_session.request.return_value.ok = False
@@ -45,4 +60,11 @@ def test_bad_request():
 def test_token_session():
     token_session = session.TokenSession("foo")
     assert token_session.token == "foo"
-    assert token_session.headers == {"Authorization": "Bearer foo"}
+    assert token_session.headers["Authorization"] == "Bearer foo"
+    assert "gzip" in token_session.headers["Accept-Encoding"]
+
+
+def test_token_session_pool():
+    token_session = session.TokenSession("foo")
+    adapter = token_session.get_adapter("https://lichess.org")
+    assert adapter._pool_maxsize == session.POOL_MAXSIZE
@@ -46,6 +46,10 @@ def test_noop():
     assert "foo" == utils.noop("foo")
 
 
+def test_compact():
+    assert utils.compact({"a": 1, "b": None, "c": False}) == {"a": 1, "c": False}
+
+
 def test_broadcast_to_str():
     mc: BroadcastPlayer = {
         "source_name": "DrNykterstein",